@@ -10,19 +10,34 @@ Run:
 Then visit http://localhost:8000/docs for the interactive Swagger UI.
 """
 
-import os
 import json
-import tempfile
-import shutil
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict
 
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from parser import ResumeParser
+from contact_extractor import extract_contact_info
+from entity_extractor import extract_entities
+from skill_extractor import extract_skills
+
+# ─── Startup ─────────────────────────────────────────────────────────────────
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Run the extractors once so the first request doesn't pay cold-start costs."""
+    sample = "John Doe\njohn@example.com\n+1-555-555-5555\nB.Tech\nPython"
+    extract_contact_info(sample)
+    extract_entities(sample)
+    extract_skills(sample, resume_parser.skills_db_path)
+    yield
+
 
 # ─── App Setup ───────────────────────────────────────────────────────────────
 
@@ -34,6 +49,7 @@ app = FastAPI(
         "JSON response with extracted candidate information."
     ),
     version="1.0.0",
+    lifespan=_lifespan,
 )
 
 # Enable CORS for frontend integration
@@ -45,6 +61,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses (batch results in particular) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize the parser
 resume_parser = ResumeParser()
 
@@ -94,18 +113,10 @@ async def parse_resume(file: UploadFile = File(...)) -> Dict:
             },
         )
 
-    # Save uploaded file to a temporary location
-    tmp_dir = tempfile.mkdtemp()
-    tmp_path = os.path.join(tmp_dir, filename)
-
     try:
-        # Write the uploaded file to disk
-        with open(tmp_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-
-        # Parse the resume
-        result = resume_parser.parse_file(tmp_path)
+        # Parse the upload straight from memory, off the event loop
+        data = await file.read()
+        result = await asyncio.to_thread(resume_parser.parse_bytes, data, filename)
 
         return JSONResponse(
             content=result,
@@ -124,9 +135,6 @@ async def parse_resume(file: UploadFile = File(...)) -> Dict:
                 "message": str(e),
             },
         )
-    finally:
-        # Clean up temporary files
-        shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 @app.post("/parse/batch", tags=["Parser"])
@@ -140,37 +148,35 @@ async def parse_resumes_batch(
     failures are included as error entries rather than failing the
     entire batch.
     """
-    results = []
-
-    for file in files:
+    async def _handle_one(file: UploadFile) -> Dict:
         filename = file.filename or "unknown"
         ext = Path(filename).suffix.lower()
 
         if ext not in ALLOWED_EXTENSIONS:
-            results.append({
+            return {
                 "file": filename,
                 "error": f"Unsupported format: {ext}",
-            })
-            continue
+            }
 
-        tmp_dir = tempfile.mkdtemp()
-        tmp_path = os.path.join(tmp_dir, filename)
+        data = await file.read()
 
-        try:
-            with open(tmp_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
+        # Parse on the thread pool so files are processed concurrently
+        return await asyncio.to_thread(resume_parser.parse_bytes, data, filename)
 
-            result = resume_parser.parse_file(tmp_path)
-            results.append(result)
+    outcomes = await asyncio.gather(
+        *(_handle_one(f) for f in files),
+        return_exceptions=True,
+    )
 
-        except Exception as e:
+    results = []
+    for file, outcome in zip(files, outcomes):
+        if isinstance(outcome, Exception):
             results.append({
-                "file": filename,
-                "error": str(e),
+                "file": file.filename or "unknown",
+                "error": str(outcome),
             })
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        else:
+            results.append(outcome)
 
     return JSONResponse(
         content={"total": len(results), "results": results},
@@ -178,9 +184,8 @@ async def parse_resumes_batch(
     )
 
 
-# Mount the frontend directory to serve CSS and JS
-# NOTE: This must be mounted AFTER all other routes so it doesn't shadow them.
-app.mount("/", StaticFiles(directory="frontend"), name="frontend")
+# Serve the frontend's CSS and JS; index.html itself is served by serve_ui
+app.mount("/static", StaticFiles(directory="frontend"), name="frontend")
 
 
 # ─── Run directly ────────────────────────────────────────────────────────────
@@ -43,21 +43,55 @@ WEBSITE_PATTERN = re.compile(
 )
 
 
+# Each pattern scans the text on its own. A single fused alternation would
+# not let matches overlap, so a profile URL nested in a longer website URL,
+# or a phone number written flush against a URL, would be swallowed.
+_LIST_PATTERNS = (
+    ("email", EMAIL_PATTERN),
+    ("phone", PHONE_PATTERN),
+    ("website", WEBSITE_PATTERN),
+)
+
+_PROFILE_PATTERNS = (
+    ("linkedin", LINKEDIN_PATTERN),
+    ("github", GITHUB_PATTERN),
+)
+
+
 # ─── Phone Normalization ────────────────────────────────────────────────────
 
-def _normalize_phone(raw_phone: str) -> str:
+# Every character the str-pattern \s class matches: ASCII whitespace, the
+# information separators \x1c-\x1f, and the Unicode space characters
+_WHITESPACE_CHARS = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
+# Deletes the separators PHONE_PATTERN can match (parentheses, dashes, dots
+# and any whitespace), leaving only digits and the optional leading '+'.
+_PHONE_STRIP_TABLE = str.maketrans('', '', '()-.' + _WHITESPACE_CHARS)
+
+
+def _normalize_phone(raw_phone: str) -> Optional[str]:
     """
-    Normalize a phone number to a cleaner format.
+    Validate and normalize a phone number in a single pass.
     Strips extraneous characters and ensures consistent formatting.
 
+    Basic validation: phone should have 7-15 digits. This filters out
+    false positives like dates (2020-2024) or zip codes.
+
     Args:
         raw_phone: Raw phone string from regex match.
 
     Returns:
-        Normalized phone string.
+        Normalized phone string, or None if it is not a valid phone.
     """
     # Remove all non-digit characters except leading +
-    digits = re.sub(r'[^\d+]', '', raw_phone)
+    digits = raw_phone.translate(_PHONE_STRIP_TABLE)
+
+    if not 7 <= len(digits.lstrip('+')) <= 15:
+        return None
 
     # If it already starts with +, keep it
     if digits.startswith('+'):
@@ -74,13 +108,37 @@ def _normalize_phone(raw_phone: str) -> str:
     return digits
 
 
-def _is_valid_phone(phone: str) -> bool:
-    """
-    Basic validation: phone should have at least 7 digits.
-    Filters out false positives like dates (2020-2024) or zip codes.
-    """
-    digits = re.sub(r'\D', '', phone)
-    return 7 <= len(digits) <= 15
+# ─── Match Handlers ─────────────────────────────────────────────────────────
+
+def _add_email(email: str, result: Dict[str, object], seen: Dict[str, set]) -> None:
+    """Record an email, deduplicating case-insensitively."""
+    lower = email.lower()
+    if lower not in seen["emails"]:
+        seen["emails"].add(lower)
+        result["emails"].append(email)
+
+
+def _add_phone(phone: str, result: Dict[str, object], seen: Dict[str, set]) -> None:
+    """Validate, normalize and record a phone number."""
+    normalized = _normalize_phone(phone)
+    if normalized is not None and normalized not in seen["phones"]:
+        seen["phones"].add(normalized)
+        result["phones"].append(normalized)
+
+
+def _add_website(url: str, result: Dict[str, object], seen: Dict[str, set]) -> None:
+    """Record a website URL that is not a LinkedIn/GitHub link."""
+    if "linkedin.com" not in url.lower() and "github.com" not in url.lower():
+        if url not in seen["websites"]:
+            seen["websites"].add(url)
+            result["websites"].append(url)
+
+
+_HANDLERS = {
+    "email": _add_email,
+    "phone": _add_phone,
+    "website": _add_website,
+}
 
 
 # ─── Public API ──────────────────────────────────────────────────────────────
@@ -109,47 +167,21 @@ def extract_contact_info(text: str) -> Dict[str, object]:
         "websites": [],
     }
 
-    # ── Emails ──
-    emails = EMAIL_PATTERN.findall(text)
-    # Deduplicate while preserving order
-    seen = set()
-    for email in emails:
-        lower = email.lower()
-        if lower not in seen:
-            seen.add(lower)
-            result["emails"].append(email)
-
-    # ── Phone Numbers ──
-    phones = PHONE_PATTERN.findall(text)
-    for phone in phones:
-        if _is_valid_phone(phone):
-            normalized = _normalize_phone(phone)
-            if normalized not in result["phones"]:
-                result["phones"].append(normalized)
-
-    # ── LinkedIn ──
-    linkedin_match = LINKEDIN_PATTERN.search(text)
-    if linkedin_match:
-        url = linkedin_match.group()
-        if not url.startswith("http"):
-            url = "https://" + url
-        result["linkedin"] = url
-
-    # ── GitHub ──
-    github_match = GITHUB_PATTERN.search(text)
-    if github_match:
-        url = github_match.group()
-        if not url.startswith("http"):
-            url = "https://" + url
-        result["github"] = url
-
-    # ── Other Websites ──
-    all_urls = WEBSITE_PATTERN.findall(text)
-    linkedin_str = result["linkedin"] or ""
-    github_str = result["github"] or ""
-    for url in all_urls:
-        if "linkedin.com" not in url.lower() and "github.com" not in url.lower():
-            if url not in result["websites"]:
-                result["websites"].append(url)
+    # Dedup sidecars so membership checks stay O(1) per match
+    seen: Dict[str, set] = {"emails": set(), "phones": set(), "websites": set()}
+
+    for kind, pattern in _LIST_PATTERNS:
+        handler = _HANDLERS[kind]
+        for match in pattern.finditer(text):
+            handler(match.group(), result, seen)
+
+    # Only the first LinkedIn/GitHub URL is kept
+    for key, pattern in _PROFILE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            url = match.group()
+            if not url.startswith("http"):
+                url = "https://" + url
+            result[key] = url
 
     return result
@@ -17,7 +17,11 @@ _SPACY_AVAILABLE = False
 try:
     import spacy
     try:
-        _nlp = spacy.load("en_core_web_sm")
+        # Only the NER component is used, so disable the rest
+        _nlp = spacy.load(
+            "en_core_web_sm",
+            disable=["tagger", "parser", "attribute_ruler", "lemmatizer"],
+        )
         _SPACY_AVAILABLE = True
     except OSError:
         # Model not downloaded — fall back to heuristics
@@ -26,6 +30,14 @@ except ImportError:
     # spaCy not installed — fall back to heuristics
     pass
 
+# ─── Aho-Corasick (Optional) ────────────────────────────────────────────────
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick not installed — fall back to per-keyword regex search
+    ahocorasick = None
+
 
 # ─── Degree Detection ───────────────────────────────────────────────────────
 
@@ -52,8 +64,12 @@ DEGREE_PATTERNS = [
     r"Liberal Arts|Fine Arts|Communications)",
 ]
 
+# Every degree pattern starts with one of these letters. Checking that first
+# lets the regex engine skip most positions without trying each alternative.
+_DEGREE_PREFIX = r'(?=[ABCDEFILMP])'
+
 DEGREE_REGEX = re.compile(
-    '|'.join(f'(?:{p})' for p in DEGREE_PATTERNS),
+    _DEGREE_PREFIX + '(?:' + '|'.join(f'(?:{p})' for p in DEGREE_PATTERNS) + ')',
     re.IGNORECASE,
 )
 
@@ -65,6 +81,11 @@ UNIVERSITY_INDICATORS = [
     "polytechnic", "conservatory",
 ]
 
+UNIVERSITY_REGEX = re.compile(
+    '|'.join(map(re.escape, UNIVERSITY_INDICATORS)),
+    re.IGNORECASE,
+)
+
 # ─── Common Title Words (to filter out from name detection) ─────────────────
 
 TITLE_KEYWORDS = [
@@ -81,16 +102,32 @@ JOB_TITLE_INDICATORS = [
     "senior", "junior", "staff", "principal", "vp", "executive",
 ]
 
+# ─── Precompiled Patterns ───────────────────────────────────────────────────
+
+_NAME_PREFIX_RE = re.compile(r'^(?:Name|Candidate Name|Full Name)\s*:?\s*', re.IGNORECASE)
+_EMAIL_CLEAN_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_URL_CLEAN_RE = re.compile(r'https?://\S+')
+_SEP_RE = re.compile(r'\|\s+')
+_DIGIT_RE = re.compile(r'\d')
+
+# Keyword lists compiled into single case-insensitive alternations
+_TITLE_RE = re.compile('|'.join(map(re.escape, TITLE_KEYWORDS)), re.IGNORECASE)
+_JOB_TITLE_RE = re.compile('|'.join(map(re.escape, JOB_TITLE_INDICATORS)), re.IGNORECASE)
+
 
 # ─── Name Extraction ────────────────────────────────────────────────────────
 
-def _extract_name_with_spacy(text: str) -> Optional[str]:
-    """Extract candidate name using spaCy PERSON entities."""
+def _extract_name_with_spacy(text: str, doc=None) -> Optional[str]:
+    """
+    Extract candidate name using spaCy PERSON entities.
+
+    If a pre-parsed Doc (or Span) of the resume header is supplied it is reused.
+    """
     if not _SPACY_AVAILABLE or _nlp is None:
         return None
 
-    header_text = text[:500]
-    doc = _nlp(header_text)
+    if doc is None:
+        doc = _nlp(text[:500])
 
     for ent in doc.ents:
         if ent.label_ == "PERSON":
@@ -109,7 +146,8 @@ def _extract_name_with_heuristics(text: str) -> Optional[str]:
 
     Strategy: The first non-empty line that looks like a personal name.
     """
-    lines = text.strip().split("\n")
+    # Only the first 10 lines are inspected, so don't split the whole resume
+    lines = text.strip().split("\n", 10)
 
     for line in lines[:10]:
         line = line.strip()
@@ -117,19 +155,19 @@ def _extract_name_with_heuristics(text: str) -> Optional[str]:
             continue
 
         # Clean line: remove common prefixes
-        line = re.sub(r'^(Name|Candidate Name|Full Name)\s*:?\s*', '', line, flags=re.IGNORECASE)
+        line = _NAME_PREFIX_RE.sub('', line)
         
         # Strip potential contact info from the same line to avoid skipping the whole line
-        clean_name_line = re.sub(r'[\w\.-]+@[\w\.-]+\.\w+', '', line) # remove email
-        clean_name_line = re.sub(r'https?://\S+', '', clean_name_line) # remove urls
-        clean_name_line = re.sub(r'\|\s+', ' ', clean_name_line) # remove separators
+        clean_name_line = _EMAIL_CLEAN_RE.sub('', line) # remove email
+        clean_name_line = _URL_CLEAN_RE.sub('', clean_name_line) # remove urls
+        clean_name_line = _SEP_RE.sub(' ', clean_name_line) # remove separators
         clean_name_line = clean_name_line.strip()
 
         if not clean_name_line or len(clean_name_line) < 3:
             continue
 
         # Skip lines with high keyword density or special characters
-        if any(kw in clean_name_line.lower() for kw in TITLE_KEYWORDS):
+        if _TITLE_RE.search(clean_name_line):
             continue
         
         # A name is typically 2-4 words, capitalized
@@ -142,22 +180,22 @@ def _extract_name_with_heuristics(text: str) -> Optional[str]:
                 for w in words
             ):
                 # Filter out job titles
-                if not any(jt in clean_name_line.lower() for jt in JOB_TITLE_INDICATORS):
+                if not _JOB_TITLE_RE.search(clean_name_line):
                     # Final sanity check: no numbers
-                    if not re.search(r'\d', clean_name_line):
+                    if not _DIGIT_RE.search(clean_name_line):
                         return clean_name_line
 
     return None
 
 
-def extract_candidate_name(text: str) -> Optional[str]:
+def extract_candidate_name(text: str, doc=None) -> Optional[str]:
     """
     Extract the candidate's name from resume text.
 
     Tries spaCy NER first, then falls back to heuristics.
     """
     # Try spaCy first
-    name = _extract_name_with_spacy(text)
+    name = _extract_name_with_spacy(text, doc)
     if name:
         return name
 
@@ -167,12 +205,13 @@ def extract_candidate_name(text: str) -> Optional[str]:
 
 # ─── Organization Extraction ────────────────────────────────────────────────
 
-def _extract_orgs_with_spacy(text: str) -> List[str]:
+def _extract_orgs_with_spacy(text: str, doc=None) -> List[str]:
     """Extract organization names using spaCy ORG entities."""
     if not _SPACY_AVAILABLE or _nlp is None:
         return []
 
-    doc = _nlp(text)
+    if doc is None:
+        doc = _nlp(text)
     orgs = []
     seen = set()
 
@@ -208,37 +247,79 @@ COMPANY_SUFFIXES = [
 ]
 
 
+def _build_company_automaton():
+    """Build an Aho-Corasick automaton over the lowercased known companies."""
+    automaton = ahocorasick.Automaton()
+    for company in KNOWN_COMPANIES:
+        key = company.lower()
+        automaton.add_word(key, (len(key), company))
+    automaton.make_automaton()
+    return automaton
+
+
+_COMPANY_AC = _build_company_automaton() if ahocorasick is not None else None
+
+# "Name Inc." / "Name LLC" style company mentions. No part of the pattern
+# can match a newline, so a single scan never joins text across lines.
+_COMPANY_SUFFIX_RE = re.compile(
+    r'([A-Z][a-zA-Z &#]+)[^\S\n]+(?:'
+    + '|'.join(re.escape(s) for s in COMPANY_SUFFIXES)
+    + r')\b',
+)
+
+
+def _is_word_char(text: str, idx: int) -> bool:
+    """True if text[idx] exists and is a regex word character."""
+    return 0 <= idx < len(text) and (text[idx].isalnum() or text[idx] == "_")
+
+
+def _find_known_companies(text: str) -> List[str]:
+    """
+    Return the KNOWN_COMPANIES mentioned in text (whole words, any case),
+    in list order. Uses a single Aho-Corasick pass when available.
+    """
+    if _COMPANY_AC is None:
+        return [
+            company for company in KNOWN_COMPANIES
+            if re.search(r'\b' + re.escape(company) + r'\b', text, re.IGNORECASE)
+        ]
+
+    lowered = text.lower()
+    found = set()
+    for end_idx, (length, company) in _COMPANY_AC.iter(lowered):
+        start = end_idx - length + 1
+        if not _is_word_char(lowered, start - 1) and not _is_word_char(lowered, end_idx + 1):
+            found.add(company)
+
+    return [company for company in KNOWN_COMPANIES if company in found]
+
+
 def _extract_orgs_with_heuristics(text: str) -> List[str]:
     """Extract organization names using pattern matching."""
     orgs = []
     seen = set()
 
     # Check for known company names
-    for company in KNOWN_COMPANIES:
-        if re.search(r'\b' + re.escape(company) + r'\b', text, re.IGNORECASE):
-            if company.lower() not in seen:
-                seen.add(company.lower())
-                orgs.append(company)
+    for company in _find_known_companies(text):
+        lower = company.lower()
+        if lower not in seen:
+            seen.add(lower)
+            orgs.append(company)
 
     # Check for company suffixes pattern: "Name Inc." / "Name LLC"
-    # Process line-by-line to avoid newlines leaking into matches
-    suffix_pattern = '|'.join(re.escape(s) for s in COMPANY_SUFFIXES)
-    company_regex = re.compile(
-        r'([A-Z][a-zA-Z &#]+)\s+(?:' + suffix_pattern + r')\b',
-    )
-    for line in text.split('\n'):
-        for match in company_regex.finditer(line):
-            full = match.group(0).strip()
-            if full.lower() not in seen and len(full) < 80:
-                seen.add(full.lower())
-                orgs.append(full)
+    for match in _COMPANY_SUFFIX_RE.finditer(text):
+        full = match.group(0).strip()
+        lower = full.lower()
+        if lower not in seen and len(full) < 80:
+            seen.add(lower)
+            orgs.append(full)
 
     return orgs
 
 
-def extract_organizations(text: str) -> List[str]:
+def extract_organizations(text: str, doc=None) -> List[str]:
     """Extract organization names, trying spaCy then heuristics."""
-    orgs = _extract_orgs_with_spacy(text)
+    orgs = _extract_orgs_with_spacy(text, doc)
     if not orgs:
         orgs = _extract_orgs_with_heuristics(text)
     return orgs
@@ -254,53 +335,54 @@ def extract_degrees(text: str) -> List[str]:
 
     for match in matches:
         cleaned = match.strip()
+        lower = cleaned.lower()
         # Filter out very short fragments (< 4 chars) that are likely noise
-        if cleaned and len(cleaned) >= 4 and cleaned.lower() not in seen:
-            seen.add(cleaned.lower())
+        if cleaned and len(cleaned) >= 4 and lower not in seen:
+            seen.add(lower)
             degrees.append(cleaned)
 
     return degrees
 
 
-def extract_universities(text: str) -> List[str]:
+def extract_universities(text: str, doc=None) -> List[str]:
     """
     Extract university/institution names from text.
 
     Uses spaCy ORG entities filtered by university indicators,
-    plus line-scanning for institution keywords.
+    plus line-scanning for institution keywords. A pre-parsed Doc
+    of the same text may be passed to skip re-running the pipeline.
     """
-    universities = []
+    # Lowercased name -> name as found, kept in insertion order
+    universities: Dict[str, str] = {}
     seen = set()
 
     # Method 1: spaCy ORG entities with university indicators
     if _SPACY_AVAILABLE and _nlp is not None:
-        doc = _nlp(text)
+        if doc is None:
+            doc = _nlp(text)
         for ent in doc.ents:
             if ent.label_ == "ORG":
                 name = ent.text.strip()
                 lower = name.lower()
-                if any(ind in lower for ind in UNIVERSITY_INDICATORS):
+                if UNIVERSITY_REGEX.search(lower):
                     if lower not in seen:
                         seen.add(lower)
-                        universities.append(name)
+                        universities[lower] = name
 
     # Method 2: Line-by-line scan for institution keywords
     for line in text.split("\n"):
         line_clean = line.strip()
         line_lower = line_clean.lower()
-        if any(ind in line_lower for ind in UNIVERSITY_INDICATORS):
+        if UNIVERSITY_REGEX.search(line_lower):
             if line_lower not in seen and len(line_clean) < 150:
                 seen.add(line_lower)
-                is_substring = any(line_lower in u.lower() for u in universities)
-                is_superstring = any(u.lower() in line_lower for u in universities)
-                if not is_substring:
-                    if is_superstring:
-                        universities = [
-                            u for u in universities if u.lower() not in line_lower
-                        ]
-                    universities.append(line_clean)
+                if not any(line_lower in u for u in universities):
+                    # Drop shorter entries that this line already covers
+                    for u in [u for u in universities if u in line_lower]:
+                        del universities[u]
+                    universities[line_lower] = line_clean
 
-    return universities
+    return list(universities.values())
 
 
 # ─── High-Level API ──────────────────────────────────────────────────────────
@@ -320,9 +402,25 @@ def extract_entities(text: str, sections: dict = None) -> Dict[str, object]:
     if sections:
         education_text = sections.get("education", "")
 
+    # Run spaCy once over every text we need. The full-text Doc is shared by
+    # organization and university extraction, and the name search reads the
+    # header as a zero-copy Span of it instead of re-parsing text[:500].
+    header_doc = full_doc = univ_doc = None
+    if _SPACY_AVAILABLE and _nlp is not None:
+        texts = [text]
+        if education_text:
+            texts.append(education_text)
+        docs = list(_nlp.pipe(texts))
+        full_doc = docs[0]
+        header_doc = (
+            full_doc.char_span(0, min(500, len(text)), alignment_mode="expand")
+            or full_doc[:0]
+        )
+        univ_doc = docs[1] if education_text else full_doc
+
     return {
-        "name": extract_candidate_name(text),
-        "organizations": extract_organizations(text),
+        "name": extract_candidate_name(text, header_doc),
+        "organizations": extract_organizations(text, full_doc),
         "degrees": extract_degrees(education_text or text),
-        "universities": extract_universities(education_text or text),
+        "universities": extract_universities(education_text or text, univ_doc),
     }
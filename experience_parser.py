@@ -6,9 +6,13 @@ structured entries with company/institution, title/degree, dates,
 and descriptions.
 """
 
+import copy
 import re
+from functools import lru_cache, wraps
 from typing import Dict, List, Optional, Tuple
 
+from entity_extractor import UNIVERSITY_REGEX, DEGREE_REGEX
+
 
 # ─── Date Patterns ──────────────────────────────────────────────────────────
 
@@ -18,8 +22,14 @@ MONTH_NAMES = (
     r"Dec(?:ember)?)"
 )
 
+# Every date starts with a month initial or a digit. Checking that first
+# lets the regex engine skip ordinary prose without trying the month
+# alternation at each position.
+_DATE_PREFIX = r'(?=[JFMASOND\d])'
+
 # Matches: "Jan 2020 - Present", "March 2019 – Dec 2021", "2018 - 2022"
 DATE_RANGE_PATTERN = re.compile(
+    _DATE_PREFIX +
     r'(' + MONTH_NAMES + r'[\s,]*\d{4}|\d{4})'
     r'\s*[\-\u2013\u2014to]+\s*'
     r'(' + MONTH_NAMES + r'[\s,]*\d{4}|\d{4}|[Pp]resent|[Cc]urrent|[Nn]ow|[Oo]ngoing)',
@@ -28,6 +38,7 @@ DATE_RANGE_PATTERN = re.compile(
 
 # Single date: "May 2023" or "2023"
 SINGLE_DATE_PATTERN = re.compile(
+    _DATE_PREFIX +
     r'(' + MONTH_NAMES + r'[\s,]*\d{4}|\d{4})',
     re.IGNORECASE,
 )
@@ -35,41 +46,71 @@ SINGLE_DATE_PATTERN = re.compile(
 # GPA pattern: "GPA: 3.8/4.0", "CGPA: 9.2/10", "3.85 GPA"
 # Requires a decimal point to avoid matching bare years like "2016"
 GPA_PATTERN = re.compile(
+    r'(?=[CG\d])'
     r'(?:(?:C?GPA|Grade)\s*:?\s*(\d+\.\d+)\s*(?:/\s*\d+\.?\d*)?|'
     r'(\d+\.\d+)\s*(?:/\s*\d+\.?\d*)?\s*(?:C?GPA|Grade))',
     re.IGNORECASE,
 )
 
 
+# ─── Precompiled Helpers ────────────────────────────────────────────────────
+
+_BLANK_LINE_SPLIT_RE = re.compile(r'\n\s*\n')
+_PIPE_SPLIT_RE = re.compile(r'\s*\|\s*')
+_AT_SPLIT_RE = re.compile(r'\s+at\s+', re.IGNORECASE)
+_TRAILING_SEP_RE = re.compile(r'\s*[\|,]\s*$')
+
+
+# ─── Memoization ────────────────────────────────────────────────────────────
+
+def _cached_entry_parser(func):
+    """
+    Memoize an entry parser on its input text.
+
+    Entry parsers are pure functions of the text, so re-analysing the same
+    resume skips all regex work. Callers receive a private copy of the
+    cached result, so mutating it cannot corrupt the cache.
+    """
+    cached = lru_cache(maxsize=4096)(func)
+
+    @wraps(func)
+    def wrapper(entry_text: str) -> Dict[str, object]:
+        return copy.deepcopy(cached(entry_text))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 # ─── Experience Parsing ────────────────────────────────────────────────────
 
+def _nonblank_lines(text: str) -> List[str]:
+    """Split text into stripped, non-empty lines, stripping each line once."""
+    return [line for line in map(str.strip, text.split("\n")) if line]
+
+
 def _split_into_entries(text: str) -> List[str]:
     """
     Split a section's text into individual entries.
     Entries are Typically separated by double newlines or date patterns.
     """
-    if not text.strip():
-        return []
-
     # Strip excessive leading/trailing whitespace
     text = text.strip()
+    if not text:
+        return []
 
     # Split on double newlines as the primary separator
-    blocks = re.split(r'\n\s*\n', text)
+    blocks = _BLANK_LINE_SPLIT_RE.split(text)
     
     # If we only got one block, try to split by date patterns at the start of lines
     if len(blocks) <= 1:
         # Match lines that START with a date or contain a date range
         # Use a more aggressive split if the section is just one long list
         entries = []
-        lines = text.split('\n')
         current = []
-        for line in lines:
-            line = line.strip()
-            if not line: continue
-            
+        for line in _nonblank_lines(text):
             # Start a new entry if this line has a date range
-            if DATE_RANGE_PATTERN.search(line) and current:
+            if current and DATE_RANGE_PATTERN.search(line):
                 entries.append("\n".join(current))
                 current = [line]
             else:
@@ -92,11 +133,24 @@ def _extract_date_range(text: str) -> Optional[Dict[str, str]]:
     return None
 
 
+def _strip_date_ranges(text: str, match: Optional[re.Match]) -> str:
+    """
+    Remove every date range from text, given the result of an earlier
+    DATE_RANGE_PATTERN.search on that same text. Same result as
+    DATE_RANGE_PATTERN.sub('', text), without re-scanning up to the first
+    match (or at all when there was none).
+    """
+    if match is None:
+        return text
+    return text[:match.start()] + DATE_RANGE_PATTERN.sub('', text[match.end():])
+
+
+@_cached_entry_parser
 def parse_experience_entry(entry_text: str) -> Dict[str, object]:
     """
     Parse a single experience entry into structured fields.
     """
-    lines = [l.strip() for l in entry_text.strip().split("\n") if l.strip()]
+    lines = _nonblank_lines(entry_text)
     if not lines:
         return {}
 
@@ -118,6 +172,7 @@ def parse_experience_entry(entry_text: str) -> Dict[str, object]:
     # 1. Check for inline date range at the END of the first line
     # Format: "Senior Developer                  Jan 2020 - Present"
     date_match = DATE_RANGE_PATTERN.search(first_line)
+    next_match = DATE_RANGE_PATTERN.search(lines[1]) if len(lines) > 1 else None
     if date_match and date_match.start() > 5:
         # We found a date range on the same line. 
         # Title is what's before it.
@@ -125,7 +180,7 @@ def parse_experience_entry(entry_text: str) -> Dict[str, object]:
         description_start = 1
         # Extract company from the next line if it's there
         if len(lines) > 1:
-            clean_company = DATE_RANGE_PATTERN.sub('', lines[1]).strip()
+            clean_company = _strip_date_ranges(lines[1], next_match).strip()
             if clean_company:
                 result["company"] = clean_company
                 description_start = 2
@@ -134,18 +189,18 @@ def parse_experience_entry(entry_text: str) -> Dict[str, object]:
     # Format: 
     #   "Software Testing Engineer" (Line 0)
     #   "Online clump Jan 2016 - Mar 2018" (Line 1)
-    elif len(lines) > 1 and DATE_RANGE_PATTERN.search(lines[1]):
+    elif next_match:
         # First line is likely the Title
-        result["title"] = DATE_RANGE_PATTERN.sub('', lines[0]).strip()
+        result["title"] = _strip_date_ranges(first_line, date_match).strip()
         # Second line contains Company and Dates
-        clean_company = DATE_RANGE_PATTERN.sub('', lines[1]).strip()
+        clean_company = _strip_date_ranges(lines[1], next_match).strip()
         if clean_company:
             result["company"] = clean_company
         description_start = 2
 
     # 3. Existing pipe and "at" split logic if title not found yet
     elif "|" in first_line:
-        pipe_split = re.split(r'\s*\|\s*', first_line)
+        pipe_split = _PIPE_SPLIT_RE.split(first_line)
         if len(pipe_split) >= 2:
             non_date_parts = [p for p in pipe_split if not DATE_RANGE_PATTERN.search(p) and not SINGLE_DATE_PATTERN.fullmatch(p)]
             if len(non_date_parts) >= 2:
@@ -157,16 +212,16 @@ def parse_experience_entry(entry_text: str) -> Dict[str, object]:
                 description_start = 1
     
     elif " at " in first_line.lower():
-        parts = re.split(r'\s+at\s+', first_line, maxsplit=1, flags=re.IGNORECASE)
+        parts = _AT_SPLIT_RE.split(first_line, maxsplit=1)
         result["title"] = parts[0].strip()
         result["company"] = DATE_RANGE_PATTERN.sub('', parts[1]).strip()
         description_start = 1
         
     else:
         # Default: first line is title, second is company
-        result["title"] = DATE_RANGE_PATTERN.sub('', first_line).strip()
+        result["title"] = _strip_date_ranges(first_line, date_match).strip()
         if len(lines) > 1:
-            result["company"] = DATE_RANGE_PATTERN.sub('', lines[1]).strip()
+            result["company"] = _strip_date_ranges(lines[1], next_match).strip()
             description_start = 2
         else:
             description_start = 1
@@ -179,7 +234,7 @@ def parse_experience_entry(entry_text: str) -> Dict[str, object]:
 
     # Remaining lines are the description
     desc_lines = lines[description_start:]
-    desc_lines = [l for l in desc_lines if not DATE_RANGE_PATTERN.search(l) or len(l) > 40]
+    desc_lines = [l for l in desc_lines if len(l) > 40 or not DATE_RANGE_PATTERN.search(l)]
     result["description"] = "\n".join(desc_lines)
 
     return result
@@ -208,6 +263,7 @@ def parse_experience_section(text: str) -> List[Dict[str, object]]:
 
 # ─── Education Parsing ──────────────────────────────────────────────────────
 
+@_cached_entry_parser
 def parse_education_entry(entry_text: str) -> Dict[str, object]:
     """
     Parse a single education entry.
@@ -225,7 +281,7 @@ def parse_education_entry(entry_text: str) -> Dict[str, object]:
     Returns:
         Dictionary with extracted fields.
     """
-    lines = [l.strip() for l in entry_text.strip().split("\n") if l.strip()]
+    lines = _nonblank_lines(entry_text)
     if not lines:
         return {}
 
@@ -254,19 +310,15 @@ def parse_education_entry(entry_text: str) -> Dict[str, object]:
     #   "B.Tech in Computer Science"
     #   "University of California, Berkeley\nB.S. in EECS\n2016-2020"
 
-    from entity_extractor import UNIVERSITY_INDICATORS, DEGREE_REGEX  # noqa
-
-    for line in lines[:3]:
-        clean = line.strip()
-        clean_lower = clean.lower()
+    for clean in lines[:3]:
+        # Date ranges removed from this line, computed at most once
+        undated = None
 
         # Check if line contains a university indicator
-        if not result["institution"] and any(
-            ind in clean_lower for ind in UNIVERSITY_INDICATORS
-        ):
+        if not result["institution"] and UNIVERSITY_REGEX.search(clean):
             # Remove date parts
-            inst = DATE_RANGE_PATTERN.sub('', clean).strip()
-            inst = SINGLE_DATE_PATTERN.sub('', inst).strip().rstrip(',').strip()
+            undated = DATE_RANGE_PATTERN.sub('', clean)
+            inst = SINGLE_DATE_PATTERN.sub('', undated).strip().rstrip(',').strip()
             if inst:
                 result["institution"] = inst
 
@@ -274,25 +326,23 @@ def parse_education_entry(entry_text: str) -> Dict[str, object]:
         if not result["degree"]:
             degree_match = DEGREE_REGEX.search(clean)
             if degree_match:
-                result["degree"] = clean
                 # Remove date parts from degree line
-                result["degree"] = DATE_RANGE_PATTERN.sub('', result["degree"]).strip()
-                result["degree"] = re.sub(r'\s*[\|,]\s*$', '', result["degree"]).strip()
+                if undated is None:
+                    undated = DATE_RANGE_PATTERN.sub('', clean)
+                result["degree"] = _TRAILING_SEP_RE.sub('', undated).strip()
 
     # If no institution found but we have lines, use first non-degree line
     if not result["institution"] and lines:
-        for line in lines[:2]:
-            clean = line.strip()
-            if clean and clean != result.get("degree"):
-                clean = DATE_RANGE_PATTERN.sub('', clean).strip()
+        for clean in lines[:2]:
+            if clean != result.get("degree"):
+                clean = DATE_RANGE_PATTERN.sub('', clean)
                 clean = SINGLE_DATE_PATTERN.sub('', clean).strip().rstrip(',').strip()
                 if clean:
                     result["institution"] = clean
                     break
 
     # Remaining text as details
-    detail_lines = [l for l in lines[2:] if l.strip()]
-    result["details"] = "\n".join(detail_lines)
+    result["details"] = "\n".join(lines[2:])
 
     return result
 
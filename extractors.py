@@ -7,55 +7,135 @@ to normalize the raw extracted text for downstream NLP processing.
 
 import re
 import io
+import os
+import threading
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, Union
 
-import pdfplumber
+import numpy as np
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTContainer, LTPage, LTTextLineHorizontal
 from docx import Document
 
+try:
+    import pymupdf
+except ImportError:
+    # PyMuPDF not installed — fall back to pdfminer layout analysis
+    pymupdf = None
+
+# PyMuPDF is not thread-safe, so only one thread may use it at a time
+_PYMUPDF_LOCK = threading.Lock()
+
 
 # ─── PDF Extraction (Layout Aware) ──────────────────────────────────────────
 
-def extract_text_from_pdf(file_path: str) -> str:
+# all_texts also runs layout analysis inside figures (form XObjects)
+_LAYOUT_PARAMS = LAParams(all_texts=True)
+
+
+def extract_text_from_pdf(file_path: Union[str, BinaryIO]) -> str:
     """
-    Extract text from PDF using pdfplumber with dynamic column detection.
+    Extract text from PDF with dynamic column detection.
     Supports asymmetrical and full-width layouts.
+    Accepts a path or a binary file-like object.
+
+    Uses PyMuPDF's native word extraction when installed, otherwise
+    pdfminer layout analysis.
+    """
+    if pymupdf is not None:
+        page_texts = _extract_pages_with_pymupdf(file_path)
+    else:
+        page_texts = (
+            _process_page(page)
+            for page in extract_pages(file_path, laparams=_LAYOUT_PARAMS)
+        )
+    return "\n\n".join(text for text in page_texts if text is not None)
+
+
+def _extract_pages_with_pymupdf(file_path: Union[str, BinaryIO]) -> List[Optional[str]]:
+    """
+    Extract layout-aware text for each page using PyMuPDF.
+
+    All PyMuPDF calls run under _PYMUPDF_LOCK; column formatting happens
+    after the lock is released.
+    """
+    data = None if isinstance(file_path, (str, Path)) else file_path.read()
+
+    pages = []
+    with _PYMUPDF_LOCK:
+        if data is None:
+            doc = pymupdf.open(file_path)
+        else:
+            doc = pymupdf.open(stream=data, filetype="pdf")
+
+        with doc:
+            for page in doc:
+                # Word tuples: (x0, y0, x1, y1, text, block_no, line_no, word_no),
+                # with y measured from the top of the page
+                words = [
+                    {'x0': w[0], 'x1': w[2], 'top': w[1], 'text': w[4]}
+                    for w in page.get_text("words")
+                ]
+                pages.append((words, page.rect.width))
+
+    return [_format_page_words(words, width) for words, width in pages]
+
+
+def _iter_text_lines(container):
+    """Yield horizontal text lines from a layout tree, including figures."""
+    for item in container:
+        if isinstance(item, LTTextLineHorizontal):
+            yield item
+        elif isinstance(item, LTContainer):
+            yield from _iter_text_lines(item)
+
+
+def _process_page(page: LTPage) -> Optional[str]:
+    """
+    Extract layout-aware text from a single pdfminer page.
+    Returns None for pages without any text.
+    """
+    # pdfminer has already grouped characters into text lines; these are
+    # the units for column detection. Y is flipped to measure from the top.
+    words = []
+    for line in _iter_text_lines(page):
+        text = " ".join(line.get_text().split())
+        if text:
+            words.append({
+                'x0': line.x0,
+                'x1': line.x1,
+                'top': page.height - line.y1,
+                'text': text,
+            })
+
+    return _format_page_words(words, page.width)
+
+
+def _format_page_words(words: List[dict], page_width: float) -> Optional[str]:
     """
-    extracted_text = []
-
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            # Extract words with their layout information
-            words = page.extract_words(
-                x_tolerance=3,
-                y_tolerance=3,
-                keep_blank_chars=False
-            )
-
-            if not words:
-                continue
-
-            # Identify if there's a strong vertical "gutter" (whitespace between columns)
-            # and find the best split point.
-            split_x = _find_column_split(words, page.width)
-
-            if split_x:
-                # Split words based on the dynamic gutter
-                left_col = [w for w in words if w['x1'] <= split_x]
-                right_col = [w for w in words if w['x0'] > split_x]
-                
-                # Heuristic: verify both columns have meaningful content
-                if len(left_col) > 0.1 * len(words) and len(right_col) > 0.1 * len(words):
-                    page_text = _format_column_words(left_col) + "\n" + _format_column_words(right_col)
-                else:
-                    page_text = _format_column_words(words)
-            else:
-                # Single column page
-                page_text = _format_column_words(words)
-
-            extracted_text.append(page_text)
-
-    return "\n\n".join(extracted_text)
+    Lay out a page's positioned text, reading columns left then right.
+    Returns None for pages without any text.
+    """
+    if not words:
+        return None
+
+    # Identify if there's a strong vertical "gutter" (whitespace between columns)
+    # and find the best split point.
+    split_x = _find_column_split(words, page_width)
+
+    if split_x:
+        # Split words based on the dynamic gutter
+        left_col = [w for w in words if w['x1'] <= split_x]
+        right_col = [w for w in words if w['x0'] > split_x]
+        
+        # Heuristic: verify both columns have meaningful content
+        if len(left_col) > 0.1 * len(words) and len(right_col) > 0.1 * len(words):
+            return _format_column_words(left_col) + "\n" + _format_column_words(right_col)
+
+    # Single column page
+    return _format_column_words(words)
 
 
 def _find_column_split(words: List[dict], page_width: float) -> Optional[float]:
@@ -63,45 +143,38 @@ def _find_column_split(words: List[dict], page_width: float) -> Optional[float]:
     Find the best vertical split point by looking for whitespace 'gutters'.
     Returns the X coordinate of the split, or None if no clear gutter exists.
     """
-    # Create a density map of X-coordinates (1px resolution)
-    # 0 = whitespace, >0 = has text
-    x_density = [0] * int(page_width + 1)
-    for w in words:
-        start = max(0, int(w['x0']))
-        end = min(int(page_width), int(w['x1']))
-        for x in range(start, end + 1):
-            x_density[x] += 1
+    # Build a density map of X-coordinates (1px resolution) with a
+    # difference array: +1 where a word starts, -1 just past where it ends,
+    # then a cumulative sum. 0 = whitespace, >0 = has text
+    size = int(page_width) + 2
+    n = len(words)
+    starts = np.fromiter((max(0, int(w['x0'])) for w in words), np.int64, n)
+    ends = np.fromiter((min(int(page_width), int(w['x1'])) for w in words), np.int64, n)
+    valid = starts <= ends
+    starts, ends = starts[valid], ends[valid]
+    delta = np.bincount(starts, minlength=size) - np.bincount(ends + 1, minlength=size)
+    x_density = np.cumsum(delta)
 
     # Look for the widest contiguous zero-density (whitespace) lane
     # that is within the 20% to 80% range of the page width.
-    best_gutter_start = 0
-    best_gutter_width = 0
-    
-    current_start = -1
     search_start = int(page_width * 0.2)
     search_end = int(page_width * 0.8)
 
-    for x in range(search_start, search_end):
-        if x_density[x] == 0:
-            if current_start == -1:
-                # Ensure we have text to the left before starting a gutter
-                if any(x_density[search_start:x]):
-                    current_start = x
-        else:
-            if current_start != -1:
-                width = x - current_start
-                if width > best_gutter_width:
-                    best_gutter_width = width
-                    best_gutter_start = current_start
-                current_start = -1
-                
-    # We don't check for gutter ending at search_end because it wouldn't be bounded on the right by text
-    # within our search range.
+    # A gutter must be bounded by text on both sides within the search
+    # range, so gutters are exactly the gaps between consecutive text columns
+    text_x = np.flatnonzero(x_density[search_start:search_end])
+    if text_x.size < 2:
+        return None
+
+    gap_widths = np.diff(text_x) - 1
+    best = int(np.argmax(gap_widths))
+    best_gutter_width = int(gap_widths[best])
+    best_gutter_start = search_start + int(text_x[best]) + 1
 
     # If the gutter is significant (> 15px), return its center
     if best_gutter_width > 15:
         return best_gutter_start + (best_gutter_width / 2)
-    
+
     return None
 
 
@@ -111,36 +184,40 @@ def _format_column_words(words: List[dict]) -> str:
         return ""
 
     # Sort words by top (Y) then x0 (X)
-    words.sort(key=lambda x: (x['top'], x['x0']))
-
+    n = len(words)
+    tops = np.fromiter((w['top'] for w in words), np.float64, n)
+    xs = np.fromiter((w['x0'] for w in words), np.float64, n)
+    order = np.lexsort((xs, tops))
+    tops = tops[order].tolist()
+    texts = [words[i]['text'] for i in order]
+
+    # A line is every word within 3 units below its first word's top. With
+    # tops sorted, each line ends at a single binary-search position.
     lines = []
-    current_line = [words[0]['text']]
-    current_top = words[0]['top']
-
-    for i in range(1, len(words)):
-        word = words[i]
-        # If the vertical difference is small, they are on the same line
-        # We also check if the horizontal gap is reasonable
-        if abs(word['top'] - current_top) < 3:
-            current_line.append(word['text'])
-        else:
-            lines.append(" ".join(current_line))
-            current_line = [word['text']]
-            current_top = word['top']
+    start = 0
+    while start < n:
+        current_top = tops[start]
+        end = bisect_left(tops, current_top + 3, start)
+        # Nudge past float rounding so the test stays `top - current_top < 3`
+        while end > start + 1 and tops[end - 1] - current_top >= 3:
+            end -= 1
+        while end < n and tops[end] - current_top < 3:
+            end += 1
+        lines.append(" ".join(texts[start:end]))
+        start = end
 
-    lines.append(" ".join(current_line))
     return "\n".join(lines)
 
 
 # ─── DOCX Extraction ────────────────────────────────────────────────────────
 
-def extract_text_from_docx(file_path: str) -> str:
+def extract_text_from_docx(file_path: Union[str, BinaryIO]) -> str:
     """
     Extract raw text from a DOCX file using python-docx.
     Reads both paragraph text and table cell text.
 
     Args:
-        file_path: Path to the DOCX file.
+        file_path: Path to the DOCX file, or a binary file-like object.
 
     Returns:
         Extracted text as a single string.
@@ -184,43 +261,141 @@ def extract_text(file_path: str) -> str:
         ValueError: If the file format is unsupported.
     """
     ext = Path(file_path).suffix.lower()
+    return clean_text(_extract_raw_text(file_path, ext))
 
-    if ext == ".pdf":
-        raw = extract_text_from_pdf(file_path)
-    elif ext in (".docx", ".doc"):
-        raw = extract_text_from_docx(file_path)
-    elif ext == ".txt":
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            raw = f.read()
-    else:
-        raise ValueError(
-            f"Unsupported file format: '{ext}'. Supported: .pdf, .docx, .txt"
-        )
 
-    cleaned = clean_text(raw)
-    
-    return cleaned
+def extract_text_from_bytes(data: bytes, filename: str) -> str:
+    """
+    Extract and clean text from an in-memory file, e.g. an upload body.
+
+    Args:
+        data: Raw file contents.
+        filename: Original file name; its extension selects the reader.
+
+    Returns:
+        Cleaned text from the document.
+
+    Raises:
+        ValueError: If the file format is unsupported.
+    """
+    ext = Path(filename).suffix.lower()
+    return clean_text(_extract_raw_text(io.BytesIO(data), ext))
+
+
+def extract_text_batch(file_paths: List[str], workers: Optional[int] = None) -> List[str]:
+    """
+    Extract and clean text from many files using a pool of worker processes.
+
+    Args:
+        file_paths: Paths to resume files (PDF, DOCX, or TXT).
+        workers: Number of worker processes (defaults to the CPU count).
+
+    Returns:
+        Cleaned text for each file, in the same order as file_paths.
+
+    Raises:
+        ValueError: If any file format is unsupported.
+    """
+    if len(file_paths) <= 1:
+        return [extract_text(p) for p in file_paths]
+
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_text, file_paths, chunksize=chunksize))
+
+
+def _extract_raw_text(source: Union[str, BinaryIO], ext: str) -> str:
+    """Read raw text from a path or binary stream based on the extension."""
+    if ext == ".pdf":
+        return extract_text_from_pdf(source)
+    if ext in (".docx", ".doc"):
+        return extract_text_from_docx(source)
+    if ext == ".txt":
+        if isinstance(source, (str, Path)):
+            with open(source, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        return io.TextIOWrapper(source, encoding="utf-8", errors="ignore").read()
+
+    raise ValueError(
+        f"Unsupported file format: '{ext}'. Supported: .pdf, .docx, .txt"
+    )
 
 
 # ─── Text Cleaning Pipeline ─────────────────────────────────────────────────
 
+# Character-level replacement tables, built once at import. Every key is a
+# non-ASCII character, so pure-ASCII text skips these steps entirely.
+
+LIGATURES = {
+    "\ufb00": "ff",
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    "\ufb05": "ft",
+    "\ufb06": "st",
+}
+
+# Common rating symbols (filled/empty circles, stars, etc.). These often
+# appear in skill sections as proficiency ratings.
+RATING_SYMBOLS = [
+    "\u25cf", "\u25cb", "\u2605", "\u2606", "\u25aa", "\u25ab",
+    "\u2b24", "\u25ef", "\u25c6", "\u25c7", "\u2713", "\u2714",
+    "\u25ce", "\u25d0", "\u25d1",
+]
+
+BULLET_CHARS = [
+    "\u2022", "\u2023", "\u25aa", "\u25cf", "\u25cb",
+    "\u2013", "\u2014", "\u25e6", "\u2043", "\u00b7",
+    "\uf0b7", "\uf0a7",
+]
+
+SMART_QUOTES = {
+    "\u2018": "'", "\u2019": "'",
+    "\u201c": '"', "\u201d": '"',
+}
+
+# Ligatures resolved and rating symbols blanked together
+_GRAPHICS_REPLACEMENTS = {**LIGATURES, **dict.fromkeys(RATING_SYMBOLS, " ")}
+
+# Bullets become line breaks; smart quotes become ASCII quotes
+_PUNCTUATION_REPLACEMENTS = {**dict.fromkeys(BULLET_CHARS, "\n"), **SMART_QUOTES}
+
+
+def _replace_all(text: str, replacements: Dict[str, str]) -> str:
+    """Apply single-character replacements, skipping pure-ASCII text."""
+    if text.isascii():
+        return text
+    for k, v in replacements.items():
+        text = text.replace(k, v)
+    return text
+
+
+# Cleanup patterns, compiled once at import rather than looked up in the
+# re module cache on every call
+_PROGRESS_BAR_RE = re.compile(r'[-_.=]{3,}')
+_GARBAGE_RE = re.compile(r'[^\x00-\x7F\s\u00A0-\u00FF]+')
+# A space between two single-character words. The literal space comes first
+# (checking the character before it with a lookbehind) so the engine can jump
+# straight to spaces instead of testing the lookbehind at every position.
+_SPACED_TEXT_RE = re.compile(r' (?<=\b\w )(?=\w\b)')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F\n]+')
+_MULTI_SPACE_RE = re.compile(r' {3,}')
+_PAGE_NUMBER_RE = re.compile(r'^\s*\d{1,2}\s*$', re.MULTILINE)
+_HEADER_FOOTER_RE = re.compile(
+    r'(?i)^(page\s*\d+.*|confidential.*|resume\s*of\s*.*|curriculum\s*vitae.*)$',
+    re.MULTILINE,
+)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+
 def resolve_ligatures(text: str) -> str:
     """
     Resolve common PDF ligatures to standard ASCII characters.
     e.g. 'ﬁ' -> 'fi', 'ﬂ' -> 'fl'
     """
-    ligatures = {
-        "\ufb00": "ff",
-        "\ufb01": "fi",
-        "\ufb02": "fl",
-        "\ufb03": "ffi",
-        "\ufb04": "ffl",
-        "\ufb05": "ft",
-        "\ufb06": "st",
-    }
-    for k, v in ligatures.items():
-        text = text.replace(k, v)
-    return text
+    return _replace_all(text, LIGATURES)
 
 
 def strip_graphics_and_garbage(text: str) -> str:
@@ -230,27 +405,18 @@ def strip_graphics_and_garbage(text: str) -> str:
     if not text:
         return ""
 
-    # 0. Resolve ligatures first
-    text = resolve_ligatures(text)
+    # 0. Resolve ligatures and strip rating symbols in one pass
+    text = _replace_all(text, _GRAPHICS_REPLACEMENTS)
 
     # 1. Remove repetitive progress bar characters (3 or more in a row)
     # e.g., "Python ------------------", "Java ..................."
-    text = re.sub(r'[-_.=]{3,}', ' ', text)
-
-    # 2. Strip common rating symbols (filled/empty circles, stars, etc.)
-    # These often appear in skill sections as proficiency ratings.
-    rating_symbols = [
-        "\u25cf", "\u25cb", "\u2605", "\u2606", "\u25aa", "\u25ab",
-        "\u25cf", "\u25cb", "\u2b24", "\u25ef", "\u25c6", "\u25c7",
-        "\u2713", "\u2714", "\u25cf", "\u25ce", "\u25d0", "\u25d1"
-    ]
-    for symbol in rating_symbols:
-        text = text.replace(symbol, " ")
-
-    # 3. Aggressive garbage collection for non-standard Unicode
+    text = _PROGRESS_BAR_RE.sub(' ', text)
+
+    # 2. Aggressive garbage collection for non-standard Unicode
     # Replace anything that isn't a standard ASCII char, common punctuation, 
-    # or whitespace with a space.
-    text = re.sub(r'[^\x00-\x7F\s\u00A0-\u00FF]+', ' ', text)
+    # or whitespace with a space. Pure-ASCII text has nothing to replace.
+    if not text.isascii():
+        text = _GARBAGE_RE.sub(' ', text)
 
     return text
 
@@ -262,7 +428,7 @@ def fix_spaced_text(text: str) -> str:
     """
     # Look for sequences of single letters separated by spaces
     # We check for at least 3 characters in a row to avoid merging normal words
-    return re.sub(r'(?<=\b\w) (?=\w\b)', '', text)
+    return _SPACED_TEXT_RE.sub('', text)
 
 
 def clean_text(text: str) -> str:
@@ -278,39 +444,28 @@ def clean_text(text: str) -> str:
     # 2. Spacer fix for some PDF outputs (e.g., "J o h n")
     text = fix_spaced_text(text)
 
-    # 2. Replace bullet characters with newlines
-    bullet_chars = ["\u2022", "\u2023", "\u25aa", "\u25cf", "\u25cb",
-                    "\u2013", "\u2014", "\u25e6", "\u2043", "\u00b7",
-                    "\uf0b7", "\uf0a7"]
-    for char in bullet_chars:
-        text = text.replace(char, "\n")
+    # 3. Replace bullet characters with newlines and smart quotes with ASCII
+    text = _replace_all(text, _PUNCTUATION_REPLACEMENTS)
 
-    # 3. Replace smart quotes and dashes
-    text = text.replace("\u2018", "'").replace("\u2019", "'")
-    text = text.replace("\u201c", '"').replace("\u201d", '"')
-    text = text.replace("\u2013", "-").replace("\u2014", "-")
-
-    # 4. Remove non-ASCII characters
-    text = re.sub(r'[^\x00-\x7F\n]+', ' ', text)
+    # 4. Remove non-ASCII characters. Each run becomes a single space, which a
+    # per-character str.translate table would not do (and on CPython a
+    # mapping-table translate is also several times slower than this sub)
+    if not text.isascii():
+        text = _NON_ASCII_RE.sub(' ', text)
 
     # 5. Normalize whitespace: collapse tabs and multiple spaces
     # BUT keep double spaces as they are used in sections
-    text = re.sub(r'\t', '  ', text)
-    text = re.sub(r' {3,}', '  ', text)
+    text = text.replace('\t', '  ')
+    text = _MULTI_SPACE_RE.sub('  ', text)
 
     # 6. Remove likely page numbers
-    text = re.sub(r'^\s*\d{1,2}\s*$', '', text, flags=re.MULTILINE)
+    text = _PAGE_NUMBER_RE.sub('', text)
 
     # 7. Remove common header/footer noise
-    text = re.sub(
-        r'(?i)^(page\s*\d+.*|confidential.*|resume\s*of\s*.*|curriculum\s*vitae.*)$',
-        '',
-        text,
-        flags=re.MULTILINE,
-    )
+    text = _HEADER_FOOTER_RE.sub('', text)
 
     # 8. Collapse multiple blank lines into one
-    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
 
     # 9. Strip leading/trailing whitespace
     text = text.strip()
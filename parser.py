@@ -14,18 +14,50 @@ Usage:
 """
 
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
-from extractors import extract_text
+from extractors import extract_text, extract_text_from_bytes
 from segmenter import segment_resume
 from contact_extractor import extract_contact_info
 from entity_extractor import extract_entities
-from skill_extractor import extract_skills, extract_skills_flat
+from skill_extractor import scan_skills
 from experience_parser import parse_experience_section, parse_education_section
 
 
+# ─── Languages Fallback ──────────────────────────────────────────────────────
+
+COMMON_LANGUAGES = [
+    "English", "Spanish", "French", "German", "Chinese", "Mandarin",
+    "Japanese", "Korean", "Hindi", "Arabic", "Portuguese", "Russian",
+    "Italian", "Bengali", "Telugu", "Marathi", "Tamil", "Urdu",
+    "Gujarati", "Kannada", "Malayalam", "Odia", "Punjabi"
+]
+
+_LANGUAGE_RE = re.compile(
+    r'\b(' + '|'.join(COMMON_LANGUAGES) + r')\b',
+    re.I,
+)
+
+# Sections already returned verbatim as top-level fields; repeating them in
+# raw_sections would only duplicate their text in the output
+_VERBATIM_SECTIONS = frozenset({
+    "summary", "projects", "frameworks", "certifications", "awards",
+    "interests",
+})
+
+_RAW_SECTION_PREVIEW = 200
+
+
+def _warm_worker(skills_db_path: str) -> None:
+    """Pool initializer: build the skill matcher once per worker process."""
+    scan_skills("Python", skills_db_path)
+
+
 class ResumeParser:
     """
     Core ATS resume parsing engine.
@@ -33,6 +65,10 @@ class ResumeParser:
     Parses resume files (PDF, DOCX, TXT) into a standardized JSON
     structure containing contact info, summary, skills, experience,
     education, projects, certifications, and more.
+
+    Instances hold no per-call state. Calls share the module-level
+    compiled regexes and lru_caches. PyMuPDF calls are serialized by
+    _PYMUPDF_LOCK in extractors.py.
     """
 
     def __init__(self, skills_db_path: str = None):
@@ -82,7 +118,7 @@ class ResumeParser:
                 "languages": "...",
                 "interests": "...",
                 "organizations_detected": [ ... ],
-                "raw_sections": { raw section texts }
+                "raw_sections": { previews of sections not returned above }
             }
 
         Raises:
@@ -97,9 +133,62 @@ class ResumeParser:
         # ─── Step 1-2: Extract and clean text ───────────────────────
         cleaned_text = extract_text(file_path)
 
+        return self._parse_text(cleaned_text, path.name)
+
+    def parse_bytes(self, data: bytes, filename: str) -> Dict:
+        """
+        Parse an in-memory resume (e.g. an upload body) without touching disk.
+
+        Args:
+            data: Raw file contents.
+            filename: Original file name; its extension selects the reader.
+
+        Returns:
+            The same structure as parse_file().
+
+        Raises:
+            ValueError: If the file format is unsupported.
+        """
+        cleaned_text = extract_text_from_bytes(data, filename)
+        return self._parse_text(cleaned_text, Path(filename).name)
+
+    def parse_files(
+        self,
+        file_paths: List[str],
+        workers: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Parse many resume files using a pool of worker processes.
+
+        Args:
+            file_paths: Paths to resume files (PDF, DOCX, or TXT).
+            workers: Number of worker processes (defaults to the CPU count).
+
+        Returns:
+            One result per file, in the same order as file_paths, each with
+            the same structure as parse_file().
+
+        Raises:
+            FileNotFoundError: If any file does not exist.
+            ValueError: If any file format is unsupported.
+        """
+        if len(file_paths) <= 1:
+            return [self.parse_file(p) for p in file_paths]
+
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_warm_worker,
+            initargs=(self.skills_db_path,),
+        ) as executor:
+            return list(executor.map(self.parse_file, file_paths, chunksize=chunksize))
+
+    def _parse_text(self, cleaned_text: str, file_name: str) -> Dict:
+        """Run steps 3-8 of the pipeline on already-cleaned resume text."""
         if not cleaned_text.strip():
             return {
-                "file": path.name,
+                "file": file_name,
                 "error": "No text could be extracted from the file.",
                 "candidate_name": None,
                 "contact": {},
@@ -115,11 +204,12 @@ class ResumeParser:
 
         # ─── Step 4: Extract contact info ───────────────────────────
         # Use header + contact section if available, else full text
-        contact_text = sections.get("header", "")
+        contact_parts = [sections.get("header", "")]
         if "contact" in sections:
-            contact_text += "\n" + sections["contact"]
+            contact_parts.append(sections["contact"])
         # Also search the first portion of full text (contact info is at top)
-        contact_text += "\n" + cleaned_text[:800]
+        contact_parts.append(cleaned_text[:800])
+        contact_text = "\n".join(contact_parts)
         contact_info = extract_contact_info(contact_text)
 
         # ─── Step 5: Extract named entities ─────────────────────────
@@ -127,15 +217,15 @@ class ResumeParser:
 
         # ─── Step 6: Extract skills ─────────────────────────────────
         # Use skills section if available, otherwise search full text
-        skills_text = sections.get("skills", cleaned_text)
+        skills_parts = [sections.get("skills", cleaned_text)]
         # Also check experience/projects for implicit skill mentions
         if "experience" in sections:
-            skills_text += "\n" + sections["experience"]
+            skills_parts.append(sections["experience"])
         if "projects" in sections:
-            skills_text += "\n" + sections["projects"]
+            skills_parts.append(sections["projects"])
+        skills_text = "\n".join(skills_parts)
 
-        categorized_skills = extract_skills(skills_text, self.skills_db_path)
-        flat_skills = extract_skills_flat(skills_text, self.skills_db_path)
+        categorized_skills, flat_skills = scan_skills(skills_text, self.skills_db_path)
 
         # ─── Step 7: Parse experience & education ───────────────────
         experience = []
@@ -150,17 +240,11 @@ class ResumeParser:
         # Languages fallback
         languages = sections.get("languages", "")
         if not languages or len(str(languages)) < 3:
-            # Fallback scan for common languages
-            common_languages = [
-                "English", "Spanish", "French", "German", "Chinese", "Mandarin",
-                "Japanese", "Korean", "Hindi", "Arabic", "Portuguese", "Russian",
-                "Italian", "Bengali", "Telugu", "Marathi", "Tamil", "Urdu",
-                "Gujarati", "Kannada", "Malayalam", "Odia", "Punjabi"
+            # Fallback scan for common languages, reported in list order
+            seen = {m.lower() for m in _LANGUAGE_RE.findall(cleaned_text)}
+            found_langs = [
+                lang for lang in COMMON_LANGUAGES if lang.lower() in seen
             ]
-            found_langs = []
-            for lang in common_languages:
-                if re.search(r'\b' + lang + r'\b', cleaned_text, re.I):
-                    found_langs.append(lang)
             if found_langs:
                 languages = ", ".join(found_langs)
         
@@ -168,7 +252,7 @@ class ResumeParser:
         frameworks = sections.get("frameworks", None)
 
         result = {
-            "file": path.name,
+            "file": file_name,
             "candidate_name": entities.get("name"),
             "contact": contact_info,
             "summary": sections.get("summary", None),
@@ -186,8 +270,10 @@ class ResumeParser:
             "degrees_detected": entities.get("degrees", []),
             "universities_detected": entities.get("universities", []),
             "raw_sections": {
-                k: v[:200] + "..." if len(v) > 200 else v
+                k: v if len(v) <= _RAW_SECTION_PREVIEW
+                else v[:_RAW_SECTION_PREVIEW] + "..."
                 for k, v in sections.items()
+                if k not in _VERBATIM_SECTIONS
             },
         }
 
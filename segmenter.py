@@ -73,6 +73,20 @@ SECTION_KEYWORDS: Dict[str, List[str]] = {
 }
 
 
+# Every (keyword, canonical section) pair, longest keyword first, built once
+_HEADING_KEYWORDS: List[Tuple[str, str]] = sorted(
+    (
+        (kw.lower(), section_name)
+        for section_name, keywords in SECTION_KEYWORDS.items()
+        for kw in keywords
+    ),
+    key=lambda x: len(x[0]),
+    reverse=True,
+)
+
+_SECTION_BY_KEYWORD: Dict[str, str] = dict(_HEADING_KEYWORDS)
+
+
 def _build_heading_pattern() -> re.Pattern:
     """
     Build a compiled regex pattern that matches any of the known section
@@ -82,15 +96,9 @@ def _build_heading_pattern() -> re.Pattern:
       - Are optionally followed by a colon
       - Appear on their own line (no significant trailing text)
     """
-    all_keywords = []
-    for keywords in SECTION_KEYWORDS.values():
-        all_keywords.extend(keywords)
-
-    # Sort by length descending so longer phrases match first
-    all_keywords.sort(key=len, reverse=True)
-
-    # Escape special regex chars and join with alternation
-    escaped = [re.escape(kw) for kw in all_keywords]
+    # Longer phrases come first so they match first; escape special regex
+    # chars and join with alternation
+    escaped = [re.escape(kw) for kw, _ in _HEADING_KEYWORDS]
     
     # Relaxed pattern: Heading must be at the start of a line,
     # followed by optional colon, and either newline or extra space.
@@ -109,16 +117,9 @@ def _normalize_section_name(heading_text: str) -> str:
     """
     cleaned = heading_text.strip().lower()
 
-    # Sort all keywords by length descending to match longest first
-    all_kw_flat = []
-    for section_name, keywords in SECTION_KEYWORDS.items():
-        for kw in keywords:
-            all_kw_flat.append((kw, section_name))
-    
-    all_kw_flat.sort(key=lambda x: len(x[0]), reverse=True)
-
-    for kw, section_name in all_kw_flat:
-        if kw.lower() in cleaned:
+    # Keywords are pre-sorted by length descending to match longest first
+    for kw, section_name in _HEADING_KEYWORDS:
+        if kw in cleaned:
             return section_name
 
     # Fallback: return the cleaned heading itself
@@ -136,7 +137,12 @@ def _find_headings(text: str) -> List[Tuple[int, int, str]]:
 
     for match in HEADING_PATTERN.finditer(text):
         raw = match.group().strip()
-        canonical = _normalize_section_name(raw)
+        # The matched text is the keyword plus an optional colon, so it maps
+        # straight to its section; the substring scan is only needed if case
+        # folding matched a non-ASCII spelling
+        canonical = _SECTION_BY_KEYWORD.get(raw.rstrip(":").rstrip().lower())
+        if canonical is None:
+            canonical = _normalize_section_name(raw)
         headings.append((match.start(), match.end(), canonical))
 
     return headings
@@ -175,7 +181,9 @@ def segment_resume(text: str) -> Dict[str, str]:
     if header_text:
         sections["header"] = header_text
 
-    # Extract content between consecutive headings
+    # Extract content between consecutive headings, collecting every
+    # occurrence of a section before joining
+    parts: Dict[str, List[str]] = {}
     for i, (start, end, section_name) in enumerate(headings):
         # Content starts after the heading line
         content_start = end
@@ -188,10 +196,10 @@ def segment_resume(text: str) -> Dict[str, str]:
 
         content = text[content_start:content_end].strip()
 
-        # If the same section appears twice, merge content
-        if section_name in sections:
-            sections[section_name] += "\n\n" + content
-        else:
-            sections[section_name] = content
+        parts.setdefault(section_name, []).append(content)
+
+    # If the same section appears more than once, merge content
+    for section_name, contents in parts.items():
+        sections[section_name] = "\n\n".join(contents)
 
     return sections
@@ -7,16 +7,35 @@ Handles variations, case-insensitive matching, and word-boundary detection.
 
 import json
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
+
+# ─── Aho-Corasick (Optional) ────────────────────────────────────────────────
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick not installed — fall back to per-variation regex search
+    ahocorasick = None
 
 
 # ─── Skill Database Loading ─────────────────────────────────────────────────
 
+def _resolve_db_path(db_path: str = None) -> str:
+    """Normalize a skills_db.json path (None → bundled file) to a cache key."""
+    if db_path is None:
+        return str((Path(__file__).parent / "skills_db.json").resolve())
+    return str(Path(db_path).resolve())
+
+
 def load_skill_database(db_path: str = None) -> List[dict]:
     """
     Load the skill ontology from a JSON file.
 
+    The parsed file is cached per path, so treat the result as read-only.
+
     Args:
         db_path: Path to the skills_db.json file. If None, looks for it
                  in the same directory as this module.
@@ -24,33 +43,37 @@ def load_skill_database(db_path: str = None) -> List[dict]:
     Returns:
         List of skill entries, each with canonical_name, category, variations.
     """
-    if db_path is None:
-        db_path = Path(__file__).parent / "skills_db.json"
-    else:
-        db_path = Path(db_path)
+    return _load_skill_database(_resolve_db_path(db_path))
 
+
+@lru_cache(maxsize=8)
+def _load_skill_database(db_path: str) -> List[dict]:
+    """Read and parse a skills_db.json file (cached per resolved path)."""
     with open(db_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
     return data.get("skills", [])
 
 
-def _build_variation_map(skills: List[dict]) -> Dict[str, dict]:
+def _build_variation_map(skills: List[dict]) -> Dict[str, Tuple[str, str]]:
     """
     Build a lookup map from every variation string (lowercased)
     to its skill entry (canonical_name, category).
 
+    All variations of a skill share one tuple, so the map holds a single
+    small object per skill rather than a dict per skill.
+
     Args:
         skills: List of skill entries from the database.
 
     Returns:
-        Dict mapping lowercase variation → {canonical_name, category}.
+        Dict mapping lowercase variation → (canonical_name, category).
     """
     vmap = {}
     for skill in skills:
         canonical = skill["canonical_name"]
         category = skill["category"]
-        info = {"canonical_name": canonical, "category": category}
+        info = (canonical, category)
 
         # Add the canonical name itself as a variation
         vmap[canonical.lower()] = info
@@ -61,8 +84,157 @@ def _build_variation_map(skills: List[dict]) -> Dict[str, dict]:
     return vmap
 
 
+@lru_cache(maxsize=8)
+def _get_variation_map(db_path: str) -> Dict[str, Tuple[str, str]]:
+    """Variation map for a resolved database path, built once."""
+    return _build_variation_map(_load_skill_database(db_path))
+
+
+@lru_cache(maxsize=8)
+def _get_variations_by_length(db_path: str) -> Tuple[str, ...]:
+    """Variations for a resolved database path, longest first, sorted once."""
+    return tuple(sorted(_get_variation_map(db_path), key=len, reverse=True))
+
+
+@lru_cache(maxsize=8)
+def _get_automaton(db_path: str):
+    """Aho-Corasick automaton for a resolved database path, or None."""
+    variation_map = _get_variation_map(db_path)
+    if ahocorasick is None or not variation_map:
+        return None
+    return _build_automaton(variation_map)
+
+
+@lru_cache(maxsize=8)
+def _get_variation_regex(db_path: str):
+    """Alternation regex and prefix table for a resolved database path."""
+    return _build_variation_regex(_get_variations_by_length(db_path))
+
+
+# ─── Variation Matching ─────────────────────────────────────────────────────
+
+_ASCII_ALNUM = frozenset(string.ascii_letters + string.digits)
+
+
+def _build_automaton(variation_map: Dict[str, Tuple[str, str]]):
+    """Build an Aho-Corasick automaton over every lowercase variation."""
+    automaton = ahocorasick.Automaton()
+    for variation in variation_map:
+        automaton.add_word(variation, (len(variation), variation))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_variation_regex(
+    variations: Tuple[str, ...],
+) -> Tuple[re.Pattern, Dict[str, List[str]]]:
+    """
+    Build the regex fallback for when pyahocorasick is unavailable: one
+    alternation of every variation (given longest first), matched inside a
+    lookahead so a scan tries every start position.
+
+    At a given start it only reports the longest variation that ends on a
+    boundary. Any other variation matching there is a prefix of that one,
+    so the returned table maps each variation to its proper prefixes that
+    are also variations, to be boundary-checked at the hit site.
+    """
+    known = set(variations)
+    pattern = re.compile(
+        r'(?<![a-zA-Z0-9])(?=('
+        + '|'.join(map(re.escape, variations))
+        + r')(?![a-zA-Z0-9]))'
+    )
+    prefixes = {
+        variation: [
+            variation[:k] for k in range(1, len(variation))
+            if variation[:k] in known
+        ]
+        for variation in variations
+    }
+    return pattern, prefixes
+
+
+def _find_variations(text_lower: str, db_path: str) -> Set[str]:
+    """
+    Return the set of variations that occur in text_lower as whole tokens
+    (not touching an ASCII letter or digit on either side). Uses a single
+    Aho-Corasick pass when available, otherwise a single scan with the
+    alternation regex.
+    """
+    variation_map = _get_variation_map(db_path)
+    if not variation_map:
+        return set()
+
+    found = set()
+    automaton = _get_automaton(db_path)
+    if automaton is not None:
+        # The automaton reports every occurrence, including overlapping and
+        # nested ones, so each variation is checked just as an independent
+        # search would. Padding the text with a space on each side keeps
+        # the boundary check to two set lookups with no range tests.
+        padded = f" {text_lower} "
+        for end_idx, (length, variation) in automaton.iter(text_lower):
+            if padded[end_idx - length + 1] not in _ASCII_ALNUM and padded[end_idx + 2] not in _ASCII_ALNUM:
+                found.add(variation)
+    else:
+        # Word-boundary matching to avoid partial matches
+        # Special handling for skills with special chars (C++, C#, .NET, etc.)
+        pattern, prefixes = _get_variation_regex(db_path)
+        for match in pattern.finditer(text_lower):
+            variation = match.group(1)
+            found.add(variation)
+            # A prefix always ends inside the match, so the character after
+            # it exists and needs no range test
+            start = match.start()
+            for prefix in prefixes[variation]:
+                if text_lower[start + len(prefix)] not in _ASCII_ALNUM:
+                    found.add(prefix)
+
+    return found
+
+
 # ─── Public API ──────────────────────────────────────────────────────────────
 
+def scan_skills(
+    text: str,
+    db_path: str = None,
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Match resume text against the skill knowledge base once, returning both
+    the categorized and the flat views of the result.
+
+    Args:
+        text: Resume text.
+        db_path: Optional path to skills_db.json.
+
+    Returns:
+        Tuple of (category → sorted skill names, sorted flat skill list).
+    """
+    # Nothing can match blank text, so don't load the database for it
+    if not text or text.isspace():
+        return {}, []
+
+    key = _resolve_db_path(db_path)
+    variation_map = _get_variation_map(key)
+
+    text_lower = text.lower()
+
+    found: Dict[str, Set[str]] = {}  # category → set of canonical names
+
+    # The category sets dedupe skills matched through several variations
+    for variation in _find_variations(text_lower, key):
+        canonical, category = variation_map[variation]
+        found.setdefault(category, set()).add(canonical)
+
+    # Convert sets to sorted lists
+    categorized = {
+        category: sorted(list(skills))
+        for category, skills in sorted(found.items())
+    }
+
+    return categorized, sorted(set().union(*found.values()))
+
+
 def extract_skills(
     text: str,
     db_path: str = None,
@@ -86,45 +258,7 @@ def extract_skills(
                 "Soft Skills": ["Leadership", "Communication"],
             }
     """
-    skills_db = load_skill_database(db_path)
-    variation_map = _build_variation_map(skills_db)
-
-    text_lower = text.lower()
-
-    found: Dict[str, Set[str]] = {}  # category → set of canonical names
-
-    # Sort variations by length descending so longer phrases match first
-    sorted_variations = sorted(variation_map.keys(), key=len, reverse=True)
-
-    matched_canonicals: Set[str] = set()
-
-    for variation in sorted_variations:
-        info = variation_map[variation]
-        canonical = info["canonical_name"]
-
-        # Skip if we already found this skill
-        if canonical in matched_canonicals:
-            continue
-
-        # Word-boundary matching to avoid partial matches
-        # Special handling for skills with special chars (C++, C#, .NET, etc.)
-        escaped = re.escape(variation)
-        pattern = r'(?<![a-zA-Z0-9])' + escaped + r'(?![a-zA-Z0-9])'
-
-        if re.search(pattern, text_lower):
-            category = info["category"]
-            if category not in found:
-                found[category] = set()
-            found[category].add(canonical)
-            matched_canonicals.add(canonical)
-
-    # Convert sets to sorted lists
-    result = {
-        category: sorted(list(skills))
-        for category, skills in sorted(found.items())
-    }
-
-    return result
+    return scan_skills(text, db_path)[0]
 
 
 def extract_skills_flat(
@@ -141,8 +275,4 @@ def extract_skills_flat(
     Returns:
         Sorted list of canonical skill names found in the text.
     """
-    categorized = extract_skills(text, db_path)
-    all_skills = []
-    for skills in categorized.values():
-        all_skills.extend(skills)
-    return sorted(set(all_skills))
+    return scan_skills(text, db_path)[1]
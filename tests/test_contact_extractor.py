@@ -0,0 +1,35 @@
+"""
+Tests for contact_extractor.
+
+Run from the repository root:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+
+from contact_extractor import extract_contact_info
+
+
+class ExtractContactInfoTest(unittest.TestCase):
+
+    def test_profile_url_nested_in_website_url(self):
+        result = extract_contact_info("Portfolio https://site.com/linkedin.com/in/abc")
+        self.assertEqual(result["linkedin"], "https://linkedin.com/in/abc")
+        self.assertEqual(result["websites"], [])
+
+    def test_phone_right_after_email(self):
+        result = extract_contact_info("john@x.com9876543210")
+        self.assertEqual(result["emails"], ["john@x.com"])
+        self.assertEqual(result["phones"], ["9876543210"])
+
+    def test_phone_right_after_url(self):
+        result = extract_contact_info("https://a.com9876543210")
+        self.assertEqual(result["phones"], ["9876543210"])
+
+    def test_phone_with_unicode_space_separators(self):
+        result = extract_contact_info("+91\u00a098765\u200943210")
+        self.assertEqual(result["phones"], ["+919876543210"])
+
+
+if __name__ == "__main__":
+    unittest.main()